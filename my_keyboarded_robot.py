@@ -19,9 +19,48 @@ along with this program.  If not, see <http://www.gnu.org/licenses/gpl-3.0.txt>.
 """
 
 import random
+import sys
 import easygopigo3 as easy
 import threading
-from time import sleep
+from itertools import accumulate, cycle
+from time import monotonic, sleep
+
+_NOTHING = lambda : "nothing"
+
+_LOGO = r"""   _____       _____ _  _____         ____  
+  / ____|     |  __ (_)/ ____|       |___ \ 
+ | |  __  ___ | |__) || |  __  ___     __) |
+ | | |_ |/ _ \|  ___/ | | |_ |/ _ \   |__ < 
+ | |__| | (_) | |   | | |__| | (_) |  ___) |
+  \_____|\___/|_|   |_|\_____|\___/  |____/ 
+                                            
+"""
+
+# bits of GoPiGo3WithKeyboard._state: left/right blinker and left/right eye
+_LB, _RB, _LE, _RE = 1, 2, 4, 8
+
+_RED = (255, 0, 0)
+_GRN = (0, 255, 0)
+_BLU = (0, 0, 255)
+_WHT = (255, 255, 255)
+
+# (right eye, left eye) colors flashed once per beat in the dance finale
+_EYE_COLOR_CYCLE = ((_RED, _BLU), (_GRN, _RED), (_BLU, _GRN), (_WHT, _WHT))
+
+def _stutter(count, beats, speed):
+    """
+    Returns ``count`` choreography steps of driving forward at ``speed`` for ``beats`` beats,
+    each followed by standing still for as long.
+    """
+    return ((speed, 100, 100, beats), (None, 0, 0, beats)) * count
+
+def _deadlines(durations, beat, offset=0):
+    """
+    Returns the time (in seconds since the dance started) at which each step of a
+    choreography table is over, given the steps' ``durations`` in beats and the
+    time ``offset`` at which the table starts.
+    """
+    return tuple(offset + beats * beat for beats in accumulate(durations))
 
 class GoPiGo3WithKeyboard(object):
     """
@@ -30,21 +69,131 @@ class GoPiGo3WithKeyboard(object):
     of the keyboard to different commands of the GoPiGo3.
     """
 
+    __slots__ = ("gopigo3", "keybindings", "order_of_keys", "_state", "_dispatch", "_menu_text",
+                 "_forward", "_backward", "_left", "_right", "_stop", "_led_on", "_led_off",
+                 "_last_speed", "_last_steer")
+
     KEY_DESCRIPTION = 0
     KEY_FUNC_SUFFIX = 1
 
-    left_blinker_on = False
-    right_blinker_on = False
-
-    left_eye_on = False
-    right_eye_on = False
+    @property
+    def left_blinker_on(self):
+        return bool(self._state & _LB)
+
+    @left_blinker_on.setter
+    def left_blinker_on(self, on):
+        self._state = self._state | _LB if on else self._state & ~_LB
+
+    @property
+    def right_blinker_on(self):
+        return bool(self._state & _RB)
+
+    @right_blinker_on.setter
+    def right_blinker_on(self, on):
+        self._state = self._state | _RB if on else self._state & ~_RB
+
+    @property
+    def left_eye_on(self):
+        return bool(self._state & _LE)
+
+    @left_eye_on.setter
+    def left_eye_on(self, on):
+        self._state = self._state | _LE if on else self._state & ~_LE
+
+    @property
+    def right_eye_on(self):
+        return bool(self._state & _RE)
+
+    @right_eye_on.setter
+    def right_eye_on(self, on):
+        self._state = self._state | _RE if on else self._state & ~_RE
+
+    # The dance is played back from tables of (speed, left, right, beats) steps:
+    # speed is passed to set_speed (None keeps the current one), left/right are
+    # steer percentages (0, 0 stops the motors) and beats is how long the step lasts.
+    _BEAT = 60 / 128
+
+    # speeds used by the choreography tables below
+    _STAR_D = 380                     # along the star's diameter
+    _STAR_HYP = _STAR_D / 2 * 1.141   # along the star's other edges
+    _TURN135 = 243                    # 135 degree turn on the spot in two beats
+    _TURN90 = _TURN135 * (90 / 135)   # 90 degree turn on the spot in two beats
+    _TURN90DEG = 310                  # 90 degree turn on the spot in one beat
+    _WALK = 250
+    _FIG8 = 320
+    _RAMP_SPEEDS = tuple(range(300, 0, -25))   # one per beat while slowing down
+
+    _DANCE_WIGGLE = ((None, 100, -100, 0.5), (None, -100, 100, 0.5))
+
+    _DANCE_OPENING = _stutter(2, 2, 300) + (
+        # beat 8
+        (300, 100, 13.5, 8),
+        # beat 16
+        ) + _stutter(8, 0.5, 300) + (
+        # beat 24: star
+        (_STAR_D, 100, 100, 2), (_TURN135, -100, 100, 2),
+        (_STAR_HYP, 100, 100, 2), (_TURN90, -100, 100, 2),
+        (_STAR_HYP, 100, 100, 2), (_TURN90, -100, 100, 2),
+        (_STAR_HYP, 100, 100, 2), (_TURN135, -100, 100, 2),
+        (_STAR_D, 100, 100, 2),
+        # beat 42: slow down
+        (_TURN90DEG, 100, -100, 1),
+        ) + tuple((speed, 100, 100, 1) for speed in _RAMP_SPEEDS) + (
+        # beat 55
+        (_TURN90DEG, 100, -100, 1),
+        ) + _stutter(8, 0.5, 300) + (
+        # beat 64: walk
+        (_TURN90DEG, 100, -100, 1),
+        (_WALK, 100, 100, 2),
+        ) + _DANCE_WIGGLE + (
+        (_WALK, 100, 100, 2),
+        # beat 70
+        ) + _DANCE_WIGGLE + (
+        (_TURN90DEG, -100, 100, 1),
+        (_WALK, 100, 100, 2),
+        ) + _DANCE_WIGGLE + (
+        (_WALK, 100, 100, 2),
+        ) + _DANCE_WIGGLE + (
+        # beat 78
+        (_TURN90DEG, -100, 100, 1),
+        (_WALK, 100, 100, 1),
+        )
+
+    _DANCE_MAIN = (
+        (_WALK, 100, 100, 1),
+        ) + _DANCE_WIGGLE + (
+        (_WALK, 100, 100, 2),
+        ) + _DANCE_WIGGLE + (
+        (_TURN90DEG, 100, -100, 1),
+        # beat 86
+        (_WALK, 100, 100, 4),
+        (_TURN90DEG, 100, -100, 1),
+        (_WALK, 100, 100, 3),
+        # beat 94: figure 8
+        (_FIG8, 100, 20, 4), (_FIG8, 20, 100, 4),
+        # beat 102
+        (_TURN90DEG, -100, 100, 8),
+        (_TURN90DEG, 100, -100, 2),
+        # beat 112: figure 8
+        (_FIG8, 20, 100, 4), (_FIG8, 100, 20, 4),
+        )
+
+    # beat 120: spin in place while the eyes flash (see _eye_show)
+    _DANCE_FINALE = ((_TURN90DEG, -100, 100, 4), (_TURN90DEG, 100, -100, 4))
+
+    # when each step of the tables above is over, in seconds since the dance started
+    _DANCE_OPENING_AT = _deadlines((move[3] for move in _DANCE_OPENING), _BEAT)
+    _DANCE_MAIN_AT = _deadlines((move[3] for move in _DANCE_MAIN), _BEAT, _DANCE_OPENING_AT[-1])
+    _DANCE_FINALE_AT = _deadlines((move[3] for move in _DANCE_FINALE), _BEAT, _DANCE_MAIN_AT[-1])
+    _EYE_SHOW_AT = _deadlines((1,) * 2 * len(_EYE_COLOR_CYCLE), _BEAT, _DANCE_MAIN_AT[-1])
 
     def __init__(self):
         """
         Instantiates the key-bindings between the GoPiGo3 and the keyboard's keys.
-        Sets the order of the keys in the menu.
+        Sets the order of the keys in the menu and prebuilds the menu text.
         """
         self.gopigo3 = easy.EasyGoPiGo3()
+        self._state = 0
         self.keybindings = {
         "w" : ["Move the GoPiGo3 forward", "forward"],
         "s" : ["Move the GoPiGo3 backward", "backward"],
@@ -72,43 +221,74 @@ class GoPiGo3WithKeyboard(object):
         }
         self.order_of_keys = ["w", "s", "a", "d", "<SPACE>", "<F1>", "<F2>", "<F3>", "1", "2", "3", "5", "7", "8", "9", "0", "e", "<ESC>"]
 
+        method_prefix = "_gopigo3_command_"
+        self._dispatch = {key : getattr(self, method_prefix + binding[self.KEY_FUNC_SUFFIX], _NOTHING)
+                          for key, binding in self.keybindings.items()}
+
+        try:
+            self._menu_text = "\n".join("\r[key {:8}] :  {}".format(key, self.keybindings[key][self.KEY_DESCRIPTION])
+                                         for key in self.order_of_keys)
+        except KeyError:
+            self._menu_text = "Error: Keys found GoPiGo3WithKeyboard.order_of_keys don't match with those in GoPiGo3WithKeyboard.keybindings."
+
+        # the gopigo3 methods called straight from the keyboard commands, bound once
+        self._forward = self.gopigo3.forward
+        self._backward = self.gopigo3.backward
+        self._left = self.gopigo3.left
+        self._right = self.gopigo3.right
+        self._stop = self.gopigo3.stop
+        self._led_on = self.gopigo3.led_on
+        self._led_off = self.gopigo3.led_off
+
+        # what the dance last sent to the motors, see _perform
+        self._last_speed = None
+        self._last_steer = None
+
     def executeKeyboardJob(self, argument):
         """
         Argument can be any of the strings stored in self.keybindings list.
 
-        For instance: if argument is "w", then the algorithm looks inside self.keybinds dict and finds
-        the "forward" value, which in turn calls the "_gopigo3_command_forward" method
+        For instance: if argument is "w", then the algorithm looks inside self._dispatch dict and finds
+        the bound "_gopigo3_command_forward" method (resolved once from self.keybindings in __init__)
         for driving the gopigo3 forward.
 
         The return values are:
-        * "nothing" - when no method could be found for the given argument.
+        * "nothing" - when no method could be found for the given argument (it is dispatched to _NOTHING).
         * "moving" - when the robot has to move forward, backward, to the left or to the right for indefinite time.
         * "path" - when the robot has to move in a direction for a certain amount of time/distance.
         * "static" - when the robot doesn't move in any direction, but instead does static things, such as turning the LEDs ON.
         * "exit" - when the key for exiting the program is pressed.
         """
-        method_prefix = "_gopigo3_command_"
-        try:
-            method_suffix = str(self.keybindings[argument][self.KEY_FUNC_SUFFIX])
-        except KeyError:
-            method_suffix = ""
-        method_name = method_prefix + method_suffix
+        return self._dispatch.get(argument, _NOTHING)()
 
-        method = getattr(self, method_name, lambda : "nothing")
+    def executeKeyboardJobs(self, arguments):
+        """
+        Runs executeKeyboardJob for every key in arguments, e.g. all the keys queued up since the last poll.
 
-        return method()
+        Repeats of a held driving key ("w", "s", "a" or "d") are dropped, since they would only send the
+        same motor command again.
+
+        Returns the value executeKeyboardJob returned for the last key that was run,
+        or "nothing" if arguments is empty. Keys queued after the exit key are not run.
+        """
+        dispatch = self._dispatch
+        last_argument = None
+        result = "nothing"
+        for argument in arguments:
+            if argument == last_argument and argument in ("w", "s", "a", "d"):
+                continue
+            result = dispatch.get(argument, _NOTHING)()
+            if result == "exit":
+                break
+            last_argument = argument
+
+        return result
 
     def drawLogo(self):
         """
         Draws the name of the GoPiGo3.
         """
-        print("   _____       _____ _  _____         ____  ")
-        print("  / ____|     |  __ (_)/ ____|       |___ \ ")
-        print(" | |  __  ___ | |__) || |  __  ___     __) |")
-        print(" | | |_ |/ _ \|  ___/ | | |_ |/ _ \   |__ < ")
-        print(" | |__| | (_) | |   | | |__| | (_) |  ___) |")
-        print("  \_____|\___/|_|   |_|\_____|\___/  |____/ ")
-        print("                                            ")
+        sys.stdout.write(_LOGO)
 
     def drawDescription(self):
         """
@@ -120,35 +300,32 @@ class GoPiGo3WithKeyboard(object):
     def drawMenu(self):
         """
         Prints all the key-bindings between the keys and the GoPiGo3's commands on the screen.
+        The menu text is built once in __init__.
         """
-        try:
-            for key in self.order_of_keys:
-                print("\r[key {:8}] :  {}".format(key, self.keybindings[key][self.KEY_DESCRIPTION]))
-        except KeyError:
-            print("Error: Keys found GoPiGo3WithKeyboard.order_of_keys don't match with those in GoPiGo3WithKeyboard.keybindings.")
+        print(self._menu_text)
 
     def _gopigo3_command_forward(self):
-        self.gopigo3.forward()
+        self._forward()
 
         return "moving"
 
     def _gopigo3_command_backward(self):
-        self.gopigo3.backward()
+        self._backward()
 
         return "moving"
 
     def _gopigo3_command_left(self):
-        self.gopigo3.left()
+        self._left()
 
         return "moving"
 
     def _gopigo3_command_right(self):
-        self.gopigo3.right()
+        self._right()
 
         return "moving"
 
     def _gopigo3_command_stop(self):
-        self.gopigo3.stop()
+        self._stop()
 
         return "moving"
 
@@ -168,447 +345,162 @@ class GoPiGo3WithKeyboard(object):
         return "path"
 
     def _gopigo3_command_leftblinker(self):
-        if self.left_blinker_on is False:
-            self.gopigo3.led_on(1)
-            self.left_blinker_on = True
-        else:
-            self.gopigo3.led_off(1)
-            self.left_blinker_on = False
+        self._state ^= _LB
+        (self._led_on if self._state & _LB else self._led_off)(1)
 
         return "static"
 
     def _gopigo3_command_rightblinker(self):
-        if self.right_blinker_on is False:
-            self.gopigo3.led_on(0)
-            self.right_blinker_on = True
-        else:
-            self.gopigo3.led_off(0)
-            self.right_blinker_on = False
+        self._state ^= _RB
+        (self._led_on if self._state & _RB else self._led_off)(0)
 
         return "static"
 
     def _gopigo3_command_blinkers(self):
-        if self.left_blinker_on is False and self.right_blinker_on is False:
-            self.gopigo3.led_on(0)
-            self.gopigo3.led_on(1)
-            self.left_blinker_on = self.right_blinker_on = True
+        if self._state & (_LB | _RB):
+            self._both_leds(False)
+            self._state &= ~(_LB | _RB)
         else:
-            self.gopigo3.led_off(0)
-            self.gopigo3.led_off(1)
-            self.left_blinker_on = self.right_blinker_on = False
+            self._both_leds(True)
+            self._state |= _LB | _RB
 
         return "static"
 
     def _gopigo3_command_lefteye(self):
-        if self.left_eye_on is False:
-            self.gopigo3.open_left_eye()
-            self.left_eye_on = True
-        else:
-            self.gopigo3.close_left_eye()
-            self.left_eye_on = False
+        self._state ^= _LE
+        (self.gopigo3.open_left_eye if self._state & _LE else self.gopigo3.close_left_eye)()
 
         return "static"
 
     def _gopigo3_command_righteye(self):
-        if self.right_eye_on is False:
-            self.gopigo3.open_right_eye()
-            self.right_eye_on = True
-        else:
-            self.gopigo3.close_right_eye()
-            self.right_eye_on = False
+        self._state ^= _RE
+        (self.gopigo3.open_right_eye if self._state & _RE else self.gopigo3.close_right_eye)()
 
         return "static"
 
     def _gopigo3_command_eyes(self):
-        if self.left_eye_on is False and self.right_eye_on is False:
-            self.gopigo3.open_eyes()
-            self.left_eye_on = self.right_eye_on = True
-        else:
+        if self._state & (_LE | _RE):
             self.gopigo3.close_eyes()
-            self.left_eye_on = self.right_eye_on = False
+            self._state &= ~(_LE | _RE)
+        else:
+            self.gopigo3.open_eyes()
+            self._state |= _LE | _RE
 
         return "static"
 
     def _gopigo3_command_eyescolor(self):
-        red = random.randint(0, 255)
-        green = random.randint(0, 255)
-        blue = random.randint(0, 255)
+        rgb = random.getrandbits(24)
 
-        self.gopigo3.set_eye_color((red, green, blue))
-        if self.left_eye_on is True:
+        self.gopigo3.set_eye_color((rgb >> 16 & 0xff, rgb >> 8 & 0xff, rgb & 0xff))
+        if self._state & _LE:
             self.gopigo3.open_left_eye()
-        if self.right_eye_on is True:
+        if self._state & _RE:
             self.gopigo3.open_right_eye()
 
         return "static"
 
+    def _both_leds(self, on):
+        """
+        Turns both blinkers ON/OFF with a single set_led write to the GoPiGo3,
+        instead of one led_on/led_off call (and SPI transfer) per blinker.
+        """
+        self.gopigo3.set_led(self.gopigo3.LED_LEFT_BLINKER | self.gopigo3.LED_RIGHT_BLINKER, 255 if on else 0)
+
     def _gopigo3_command_exit(self):
         return "exit"
     
     def _gopigo3_command_activatedance(self):
-        beat = 60/128
-        self.gopigo3.set_speed(300)
-        turn90Deg = 310
-        self.gopigo3.close_eyes()
-            
-        """
-        self.gopigo3.set_speed(1000)
-        self.gopigo3.forward()
-        sleep(beat*4)
-        
-        self.gopigo3.stop()
-        self.gopigo3.set_speed(300)
+        g = self.gopigo3
+        perform = self._perform
+        g.close_eyes()
+
+        # the motors may have been driven outside of the dance since it last ran
+        self._last_speed = self._last_steer = None
+
+        # Every step is timed against a single monotonic start time, so the
+        # timer slack of one sleep is absorbed by the next instead of piling up.
+        start = monotonic()
+        perform(self._DANCE_OPENING, self._DANCE_OPENING_AT, start)
+
+        """beat 80"""
+        g.open_eyes()
+        self._both_leds(True)
+        perform(self._DANCE_MAIN, self._DANCE_MAIN_AT, start)
+
+        """beat 120"""
+        # the eyes flash on their own thread while the motors spin in place
+        eye_show = threading.Thread(target=self._eye_show, args=(self._EYE_SHOW_AT, start))
+        eye_show.daemon = True
+        eye_show.start()
+        perform(self._DANCE_FINALE, self._DANCE_FINALE_AT, start)
+        eye_show.join()
+
+        g.close_eyes()
+        self._both_leds(False)
+
+        g.stop()
+        g.set_speed(500)
         return "static"
+
+    def _perform(self, moves, deadlines, start):
         """
-        
-        
-        
-        
-        
-        
-        
-        """beat 0"""
-        self.gopigo3.steer(100, 100)
-        sleep(beat * 2)
-        self.gopigo3.stop()
-        sleep(beat * 2)
-        
-        self.gopigo3.steer(100, 100)
-        sleep(beat * 2)
-        self.gopigo3.stop()
-        sleep(beat * 2)
-        
+        Plays back a table of (speed, left, right, beats) dance steps.
+
+        Each step lasts until its entry in ``deadlines`` (seconds after the monotonic ``start`` time).
+        A speed or steer the motors already run at is not sent again.
+
+        Steps of 0, 0 call stop() and steps of 100, 100 call forward(), which drives both motors
+        at the current speed with one write, just like steer(100, 100) does with two.
         """
-        self.gopigo3.set_speed(300)
-        self.gopigo3.orbit(180, 15)
+        # bind the methods once rather than looking them up on every step
+        g = self.gopigo3
+        set_speed, steer, stop, forward = g.set_speed, g.steer, g.stop, g.forward
+        hold = self._hold
+
+        # what the dance last sent to the motors, so that repeated writes can be skipped
+        last_speed, last_steer = self._last_speed, self._last_steer
+
+        for (speed, left, right, _), deadline in zip(moves, deadlines):
+            if speed is not None and speed != last_speed:
+                set_speed(speed)
+                last_speed = speed
+                # steer scales with the speed, so the next one has to be sent again
+                last_steer = None
+            if (left, right) != last_steer:
+                if left == right == 0:
+                    stop()
+                elif left == right == 100:
+                    forward()
+                else:
+                    steer(left, right)
+                last_steer = (left, right)
+            hold(start + deadline)
+
+        self._last_speed, self._last_steer = last_speed, last_steer
+
+    def _eye_show(self, deadlines, start):
         """
-        self.gopigo3.set_speed(300)
-        self.gopigo3.steer(100, 13.5)
-        sleep(beat*8)
-        
-        
-        """beat 16"""
-        self.gopigo3.set_speed(300)
-        self.gopigo3.steer(100, 100)
-        sleep(beat / 2)
-        self.gopigo3.stop()
-        sleep(beat / 2)
-        self.gopigo3.steer(100, 100)
-        sleep(beat / 2)
-        self.gopigo3.stop()
-        sleep(beat / 2)
-        self.gopigo3.steer(100, 100)
-        sleep(beat / 2)
-        self.gopigo3.stop()
-        sleep(beat / 2)
-        self.gopigo3.steer(100, 100)
-        sleep(beat / 2)
-        self.gopigo3.stop()
-        sleep(beat / 2)
-        
-        self.gopigo3.steer(100, 100)
-        sleep(beat / 2)
-        self.gopigo3.stop()
-        sleep(beat / 2)
-        self.gopigo3.steer(100, 100)
-        sleep(beat / 2)
-        self.gopigo3.stop()
-        sleep(beat / 2)
-        self.gopigo3.steer(100, 100)
-        sleep(beat / 2)
-        self.gopigo3.stop()
-        sleep(beat / 2)
-        self.gopigo3.steer(100, 100)
-        sleep(beat / 2)
-        self.gopigo3.stop()
-        sleep(beat / 2)
-        
-        """beat 24"""
-        
-        starDriveDiameter = 380
-        starDriveHypotenuse = starDriveDiameter / 2 * 1.141
-        
-        starTurnSpeed135 = 243
-        self.gopigo3.set_speed(starDriveDiameter)
-        self.gopigo3.steer(100, 100)
-        sleep(beat * 2)
-        self.gopigo3.set_speed(starTurnSpeed135)
-        self.gopigo3.steer(-100, 100)
-        sleep(beat * 2)
-        
-        self.gopigo3.set_speed(starDriveHypotenuse)
-        self.gopigo3.steer(100, 100)
-        sleep(beat * 2)
-        self.gopigo3.set_speed(starTurnSpeed135 * (90/135))
-        self.gopigo3.steer(-100, 100)
-        sleep(beat * 2)
-        
-        self.gopigo3.set_speed((starDriveHypotenuse))
-        self.gopigo3.steer(100, 100)
-        sleep(beat * 2)
-        self.gopigo3.set_speed(starTurnSpeed135 * (90/135))
-        self.gopigo3.steer(-100, 100)
-        sleep(beat * 2)
-        
-        self.gopigo3.set_speed(starDriveHypotenuse)
-        self.gopigo3.steer(100, 100)
-        sleep(beat * 2)
-        self.gopigo3.set_speed(starTurnSpeed135)
-        self.gopigo3.steer(-100, 100)
-        sleep(beat * 2)
-        
-        self.gopigo3.set_speed(starDriveDiameter)
-        self.gopigo3.steer(100, 100)
-        sleep(beat * 2)
-        
-        """Beat 42"""
-        self.gopigo3.set_speed(turn90Deg)
-        self.gopigo3.steer(100, -100)
-        sleep(beat)
-        
-        self.gopigo3.set_speed(250)
-        slowCounter = 12
-        while slowCounter > 0:
-            self.gopigo3.set_speed(slowCounter * 25)
-            self.gopigo3.steer(100, 100)
-            slowCounter -= 1
-            sleep(beat)
-        
-        """Beat 55"""
-        self.gopigo3.set_speed(turn90Deg)
-        self.gopigo3.steer(100, -100)
-        sleep(beat)
-        
-        self.gopigo3.set_speed(300)
-        self.gopigo3.steer(100, 100)
-        sleep(beat / 2)
-        self.gopigo3.stop()
-        sleep(beat / 2)
-        self.gopigo3.steer(100, 100)
-        sleep(beat / 2)
-        self.gopigo3.stop()
-        sleep(beat / 2)
-        self.gopigo3.steer(100, 100)
-        sleep(beat / 2)
-        self.gopigo3.stop()
-        sleep(beat / 2)
-        self.gopigo3.steer(100, 100)
-        sleep(beat / 2)
-        self.gopigo3.stop()
-        sleep(beat / 2)
-        
-        self.gopigo3.steer(100, 100)
-        sleep(beat / 2)
-        self.gopigo3.stop()
-        sleep(beat / 2)
-        self.gopigo3.steer(100, 100)
-        sleep(beat / 2)
-        self.gopigo3.stop()
-        sleep(beat / 2)
-        self.gopigo3.steer(100, 100)
-        sleep(beat / 2)
-        self.gopigo3.stop()
-        sleep(beat / 2)
-        self.gopigo3.steer(100, 100)
-        sleep(beat / 2)
-        self.gopigo3.stop()
-        sleep(beat / 2)
-        
-        """Beat 64"""
-        walkSpeed = 250
-        self.gopigo3.set_speed(turn90Deg)
-        self.gopigo3.steer(100, -100)
-        sleep(beat)
-        
-        self.gopigo3.set_speed(walkSpeed)
-        self.gopigo3.forward()
-        sleep(beat * 2)
-        
-        self.gopigo3.steer(100, -100)
-        sleep(beat/2)
-        self.gopigo3.steer(-100, 100)
-        sleep(beat/2)
-        
-        self.gopigo3.set_speed(walkSpeed)
-        self.gopigo3.forward()
-        sleep(beat * 2)
-        
-        """Beat 70"""
-        self.gopigo3.steer(100, -100)
-        sleep(beat/2)
-        self.gopigo3.steer(-100, 100)
-        sleep(beat/2)
-        
-        self.gopigo3.set_speed(turn90Deg)
-        self.gopigo3.steer(-100, 100)
-        sleep(beat)
-        
-        self.gopigo3.set_speed(walkSpeed)
-        self.gopigo3.forward()
-        sleep(beat * 2)
-        
-        self.gopigo3.steer(100, -100)
-        sleep(beat/2)
-        self.gopigo3.steer(-100, 100)
-        sleep(beat/2)
-        
-        self.gopigo3.set_speed(walkSpeed)
-        self.gopigo3.forward()
-        sleep(beat * 2)
-        
-        self.gopigo3.steer(100, -100)
-        sleep(beat/2)
-        self.gopigo3.steer(-100, 100)
-        sleep(beat/2)
-        
-        """Beat 78"""
-        
-        self.gopigo3.set_speed(turn90Deg)
-        self.gopigo3.steer(-100, 100)
-        sleep(beat)
-        
-        self.gopigo3.set_speed(walkSpeed)
-        self.gopigo3.forward()
-        sleep(beat * 1)
-        
-        self.gopigo3.open_eyes()
-        self.gopigo3.blinker_on(0)
-        self.gopigo3.blinker_on(1)
-        self.gopigo3.set_speed(walkSpeed)
-        self.gopigo3.forward()
-        sleep(beat * 1)
-        
-        self.gopigo3.steer(100, -100)
-        sleep(beat/2)
-        self.gopigo3.steer(-100, 100)
-        sleep(beat/2)
-        
-        self.gopigo3.set_speed(walkSpeed)
-        self.gopigo3.forward()
-        sleep(beat * 2)
-        
-        self.gopigo3.steer(100, -100)
-        sleep(beat/2)
-        self.gopigo3.steer(-100, 100)
-        sleep(beat/2)
-                
-        self.gopigo3.set_speed(turn90Deg)
-        self.gopigo3.steer(100, -100)
-        sleep(beat)
-        
-        """Beat 86"""
-        self.gopigo3.set_speed(walkSpeed)
-        self.gopigo3.forward();
-        sleep(beat * 4)
-        self.gopigo3.set_speed(turn90Deg)
-        self.gopigo3.steer(100, -100);
-        sleep(beat * 1)
-        self.gopigo3.set_speed(walkSpeed)
-        self.gopigo3.forward();
-        sleep(beat * 3)
-        
-        """Beat 94"""
-        
-        
-        figure8speed = 320;
-        
-        self.gopigo3.set_speed(figure8speed)
-        self.gopigo3.steer(100, 20)
-        sleep(beat * 4)
-        self.gopigo3.set_speed(figure8speed)
-        self.gopigo3.steer(20, 100)
-        sleep(beat * 4)
-        
-        """Beat 102"""
-        self.gopigo3.set_speed(turn90Deg)
-        self.gopigo3.steer(-100, 100)
-        sleep(beat*8)
-                
-        self.gopigo3.set_speed(turn90Deg)
-        self.gopigo3.steer(100, -100)
-        sleep(beat*2)
-        
-        """Beat 112"""
-        self.gopigo3.set_speed(figure8speed)
-        self.gopigo3.steer(20, 100)
-        sleep(beat * 4)
-        self.gopigo3.set_speed(figure8speed)
-        self.gopigo3.steer(100, 20)
-        sleep(beat * 4)
-        
-        """Beat 120"""
-        self.gopigo3.set_speed(turn90Deg)
-        self.gopigo3.steer(-100, 100)
- 
-
-        self.gopigo3.set_right_eye_color((255,0,0))
-        self.gopigo3.set_left_eye_color((0,0,255))
-        self.gopigo3.close_eyes()
-        self.gopigo3.open_eyes()
-        sleep(beat)
-        self.gopigo3.set_right_eye_color((0,255,0))
-        self.gopigo3.set_left_eye_color((255,0,0))
-        self.gopigo3.close_eyes()
-        self.gopigo3.open_eyes()
-        sleep(beat)
-        self.gopigo3.set_right_eye_color((0,0,255))
-        self.gopigo3.set_left_eye_color((0,255,0))
-        self.gopigo3.close_eyes()
-        self.gopigo3.open_eyes()
-        sleep(beat)
-        self.gopigo3.set_right_eye_color((255,255,255))
-        self.gopigo3.set_left_eye_color((255,255,255))
-        self.gopigo3.close_eyes()
-        self.gopigo3.open_eyes()
-        sleep(beat)
-            
-        finishCounter = 0
-        self.gopigo3.set_speed(turn90Deg)
-        self.gopigo3.steer(100, -100)
-        
-        
-        self.gopigo3.set_right_eye_color((255,0,0))
-        self.gopigo3.set_left_eye_color((0,0,255))
-        self.gopigo3.close_eyes()
-        self.gopigo3.open_eyes()
-        sleep(beat)
-        self.gopigo3.set_right_eye_color((0,255,0))
-        self.gopigo3.set_left_eye_color((255,0,0))
-        self.gopigo3.close_eyes()
-        self.gopigo3.open_eyes()
-        sleep(beat)
-        self.gopigo3.set_right_eye_color((0,0,255))
-        self.gopigo3.set_left_eye_color((0,255,0))
-        self.gopigo3.close_eyes()
-        self.gopigo3.open_eyes()
-        sleep(beat)
-        self.gopigo3.set_right_eye_color((255,255,255))
-        self.gopigo3.set_left_eye_color((255,255,255))
-        self.gopigo3.close_eyes()
-        self.gopigo3.open_eyes()
-        sleep(beat)
-        
-        
+        Flashes the eyes through _EYE_COLOR_CYCLE, one color pair per entry in ``deadlines``.
+        Timed like _perform, so that it can run on a separate thread alongside it.
+        """
+        g = self.gopigo3
+        set_right_eye_color, set_left_eye_color = g.set_right_eye_color, g.set_left_eye_color
+        close_eyes, open_eyes = g.close_eyes, g.open_eyes
+        hold = self._hold
+
+        for (right_color, left_color), deadline in zip(cycle(_EYE_COLOR_CYCLE), deadlines):
+            set_right_eye_color(right_color)
+            set_left_eye_color(left_color)
+            close_eyes()
+            open_eyes()
+            hold(start + deadline)
+
+    def _hold(self, deadline):
+        """
+        Sleeps until the monotonic clock reaches ``deadline``.
+        """
+        sleep(max(0, deadline - monotonic()))
 
-        self.gopigo3.close_eyes()
-        self.gopigo3.blinker_off(0)
-        self.gopigo3.blinker_off(1)
-        
-        self.gopigo3.stop()
-        self.gopigo3.set_speed(500)
-        return "static"
-        
-        
-        
-        
-        
-        
-        
-        
-        
-        
-        
-        
     def _gopigo3_command_deliveraltoids(self):
         
         self.gopigo3.set_speed(300)